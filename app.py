@@ -1,13 +1,44 @@
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QListWidget, QTextEdit, QLabel, QPushButton, QDoubleSpinBox, QListWidgetItem
+    QLineEdit, QListView, QListWidget, QTextEdit, QLabel, QPushButton, QDoubleSpinBox, QListWidgetItem
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer
 from PyQt6.QtGui import QColor
+import numpy as np
 from backend import Backend, Skin
-import pandas as pd
+
+FILTER_DEBOUNCE_MS = 120  # Delay after the last keystroke before re-filtering
+
+class SkinListModel(QAbstractListModel):
+    """List model over item IDs; names and colors come from the cached Skin objects"""
+
+    def __init__(self, backend: Backend) -> None:
+        super().__init__()
+        self.backend: Backend = backend
+        self._ids: List[int] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item_id = self._ids[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.backend.get_skin(item_id).name
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.backend.get_skin(item_id).get_brush()
+        if role == Qt.ItemDataRole.UserRole:
+            return item_id
+        return None
+
+    def set_ids(self, item_ids: List[int]) -> None:
+        """Replace the displayed items in a single model reset"""
+        self.beginResetModel()
+        self._ids = list(item_ids)
+        self.endResetModel()
 
 class RowWidget(QWidget):
     def __init__(
@@ -21,6 +52,7 @@ class RowWidget(QWidget):
         self.parent_list: QListWidget = parent_list
         self.parent_calculator: 'TradeCalculator' = parent_calculator
         self.skin: Skin = skin
+        self._list_item: Optional[QListWidgetItem] = None  # Set by the owner once the row is added
 
         layout: QHBoxLayout = QHBoxLayout()
         layout.setContentsMargins(5, 2, 5, 2)
@@ -59,11 +91,9 @@ class RowWidget(QWidget):
         self.parent_calculator.analyze_and_display_selection()
 
     def delete_self(self) -> None:
-        # Find and remove this row from the list
-        for i in range(self.parent_list.count()):
-            if self.parent_list.itemWidget(self.parent_list.item(i)) == self:
-                self.parent_list.takeItem(i)
-                break
+        # Remove this row from the list via its stored item handle
+        self.parent_list.takeItem(self.parent_list.row(self._list_item))
+        self.parent_calculator._active_rows.remove(self)
         
         # Reset the filter when an item is deleted
         self.parent_calculator.reset_filter()
@@ -81,17 +111,23 @@ class TradeCalculator(QWidget):
         self.backend: Backend = Backend(self)
         
         # Get list of all item IDs (already filtered by backend)
-        self.item_ids: List[int] = self.backend.get_item_list()
+        self.item_ids: np.ndarray = self.backend.get_item_list()
         
         # Pre-build lookup dictionaries for fast filtering (cache skin properties)
         self._id_to_name = {}
-        self._id_to_rarity = {}
-        for item_id in self.item_ids:
+        # (lowercase name, id) pairs in list order, so filtering avoids per-item dict lookups
+        self._name_index: List[Tuple[str, int]] = []
+        for item_id in self.item_ids.tolist():
             skin = self.backend.get_skin(item_id)
             self._id_to_name[item_id] = skin.name.lower()
-            self._id_to_rarity[item_id] = skin.rarity
+            self._name_index.append((self._id_to_name[item_id], item_id))
+        
+        # Last search and its matches; a longer query only needs to narrow these
+        self._last_filter_text: str = ""
+        self._last_filter_matches: List[Tuple[str, int]] = self._name_index
         
         self.current_rarity_filter: Optional[str] = None  # Track current rarity filter
+        self._active_rows: List[RowWidget] = []  # Rows in the detail view, in display order
 
         self.init_ui()
 
@@ -101,21 +137,30 @@ class TradeCalculator(QWidget):
         # Search bar
         self.search_bar: QLineEdit = QLineEdit()
         self.search_bar.setPlaceholderText("Search...")
-        self.search_bar.textChanged.connect(self.filter_list)
+        self.search_bar.textChanged.connect(self.schedule_filter)
+
+        # Debounce typing so only the last keystroke in a burst rebuilds the list
+        self._pending_filter_text: str = ""
+        self._filter_timer: QTimer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._do_filter)
 
         # Horizontal layout for left/right
         content_layout: QHBoxLayout = QHBoxLayout()
 
-        # Left list
-        self.list_widget: QListWidget = QListWidget()
+        # Left list (model/view, so only visible rows are rendered)
+        self.list_model: SkinListModel = SkinListModel(self.backend)
+        self.list_view: QListView = QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.list_model)
         self.populate_list(self.item_ids)
-        self.list_widget.itemClicked.connect(self.show_item)
+        self.list_view.clicked.connect(self.show_item)
 
         # Right display
         self.detail_view: QListWidget = QListWidget()
         self.detail_view.setDisabled(False)
 
-        content_layout.addWidget(self.list_widget, 1)
+        content_layout.addWidget(self.list_view, 1)
         content_layout.addWidget(self.detail_view, 2)
 
         main_layout.addWidget(self.search_bar)
@@ -125,45 +170,54 @@ class TradeCalculator(QWidget):
 
         self.output_box: QTextEdit = QTextEdit()
         self.output_box.setReadOnly(True)
+        self.output_box.setUndoRedoEnabled(False)
+        self._last_output: Optional[str] = None
         main_layout.addWidget(self.output_box)
 
     def populate_list(self, item_ids: List[int]) -> None:
-        """Add items to the list with rarity-based colors"""
-        from PyQt6.QtGui import QBrush
-        
-        for item_id in item_ids:
-            skin = self.backend.get_skin(item_id)
-            list_item: QListWidgetItem = QListWidgetItem(skin.name)
-            list_item.setData(Qt.ItemDataRole.UserRole, item_id)  # Store ID in item
-            list_item.setForeground(QBrush(skin.get_color()))
-            self.list_widget.addItem(list_item)
+        """Show the given items in the list with rarity-based colors"""
+        self.list_model.set_ids(item_ids)
+
+    def schedule_filter(self, text: str) -> None:
+        """Restart the debounce timer with the latest search text"""
+        self._pending_filter_text = text
+        self._filter_timer.start(FILTER_DEBOUNCE_MS)
+
+    def _do_filter(self) -> None:
+        self.filter_list(self._pending_filter_text)
 
     def filter_list(self, text: str) -> None:
         """Fast filtering using cached name lookups"""
-        self.list_widget.clear()
+        # A text search replaces whatever rarity filter the list was showing
+        self.current_rarity_filter = None
         if not text:
             self.populate_list(self.item_ids)
             return
             
         text_lower = text.lower()
-        filtered_ids = [item_id for item_id in self.item_ids 
-                       if text_lower in self._id_to_name[item_id]]
-        self.populate_list(filtered_ids)
+        # Any name containing the new text also contains the previous text,
+        # so extending a query only has to rescan the previous matches
+        if self._last_filter_text and self._last_filter_text in text_lower:
+            candidates = self._last_filter_matches
+        else:
+            candidates = self._name_index
+        matches = [(name, item_id) for name, item_id in candidates if text_lower in name]
+        self._last_filter_text = text_lower
+        self._last_filter_matches = matches
+        self.populate_list([item_id for _, item_id in matches])
     
     def filter_by_rarity(self, rarity: str) -> None:
-        """Fast filtering by rarity using cached lookups"""
-        self.list_widget.clear()
+        """Fast filtering by rarity using the backend's rarity codes"""
         self.current_rarity_filter = rarity
         
         search_text = self.search_bar.text().lower()
+        rarity_ids = self.backend.get_item_list_by_rarity(rarity)
         
         if search_text:
-            filtered_ids = [item_id for item_id in self.item_ids 
-                           if self._id_to_rarity[item_id] == rarity 
-                           and search_text in self._id_to_name[item_id]]
+            filtered_ids = [item_id for item_id in rarity_ids.tolist()
+                           if search_text in self._id_to_name[item_id]]
         else:
-            filtered_ids = [item_id for item_id in self.item_ids 
-                           if self._id_to_rarity[item_id] == rarity]
+            filtered_ids = rarity_ids
         
         self.populate_list(filtered_ids)
     
@@ -174,24 +228,25 @@ class TradeCalculator(QWidget):
         if search_text:
             self.filter_list(search_text)
         else:
-            self.list_widget.clear()
             self.populate_list(self.item_ids)
 
-    def show_item(self, item: QListWidgetItem) -> None:
-        # Get the item ID from the list item
-        item_id: int = item.data(Qt.ItemDataRole.UserRole)
+    def show_item(self, index: QModelIndex) -> None:
+        # Get the item ID from the clicked row
+        item_id: int = index.data(Qt.ItemDataRole.UserRole)
         
         # Create a Skin instance
         skin: Skin = self.backend.get_skin(item_id)
         
-        # Filter the left list to show only items with the same rarity
-        self.filter_by_rarity(skin.rarity)
+        # Filter the left list to show only items with the same rarity (skip if already shown)
+        if self.current_rarity_filter != skin.rarity:
+            self.filter_by_rarity(skin.rarity)
         
         # Create a list item
         list_item: QListWidgetItem = QListWidgetItem(self.detail_view)
         
         # Create the custom row widget with skin
         row_widget: RowWidget = RowWidget(skin, self.detail_view, self)
+        row_widget._list_item = list_item
         
         # Set size hint so the item is tall enough for the widget
         list_item.setSizeHint(row_widget.sizeHint())
@@ -199,19 +254,14 @@ class TradeCalculator(QWidget):
         # Add the item and set the custom widget
         self.detail_view.addItem(list_item)
         self.detail_view.setItemWidget(list_item, row_widget)
+        self._active_rows.append(row_widget)
         
         # Analyze and display the selected items
         self.analyze_and_display_selection()
     
     def analyze_and_display_selection(self) -> None:
         """Collect all selected skins and analyze them"""
-        selected_skins: List[Skin] = []
-        
-        # Iterate through all items in the detail view
-        for i in range(self.detail_view.count()):
-            widget = self.detail_view.itemWidget(self.detail_view.item(i))
-            if isinstance(widget, RowWidget):
-                selected_skins.append(widget.skin)
+        selected_skins: List[Skin] = [row.skin for row in self._active_rows]
         
         # Get analysis from backend
         analysis_result: str = self.backend.analyze_selected_skins(selected_skins)
@@ -220,7 +270,11 @@ class TradeCalculator(QWidget):
         self.update_output(f"Selected {len(selected_skins)} items\n\n{analysis_result}")
 
     def update_output(self, text: str) -> None:
-        self.output_box.setText(text)
+        # Skip the relayout when the text hasn't changed (e.g. spinbox ticks that round the same)
+        if text == self._last_output:
+            return
+        self._last_output = text
+        self.output_box.setPlainText(text)
 
 app: QApplication = QApplication(sys.argv)
 window: TradeCalculator = TradeCalculator()
@@ -1,8 +1,32 @@
+import numpy as np
 import pandas as pd
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QBrush, QColor
 from typing import List, Tuple, Optional
 import ast
-from collections import defaultdict
+import json
+from collections import OrderedDict
+
+# Shared per-rarity colors/brushes, built once instead of on every get_color() call
+_RARITY_COLORS = {
+    "Consumer Grade": QColor("gray"),
+    "Industrial Grade": QColor("lightgray"),
+    "Mil-Spec Grade": QColor("blue"),
+    "Restricted": QColor("purple"),
+    "Classified": QColor("orange"),
+    "Covert": QColor("red"),
+    "Contraband": QColor("black"),
+    "Extraordinary": QColor("gold")
+}
+_RARITY_BRUSHES = {rarity: QBrush(color) for rarity, color in _RARITY_COLORS.items()}
+
+def _parse_list_literal(text: str) -> List[str]:
+    """Parse a Python list-of-strings literal such as "['crate-1', 'crate-2']"."""
+    try:
+        # json.loads is much cheaper than building an AST once quotes are normalized
+        return json.loads(text.replace("'", '"'))
+    except json.JSONDecodeError:
+        # Strings containing quotes don't survive the swap; fall back to the exact parser
+        return ast.literal_eval(text)
 
 class Skin:
     """
@@ -21,47 +45,81 @@ class Skin:
         float (Optional[float]): Float value for this specific instance (if set)
     
     Note: StatTrak and non-StatTrak versions are considered distinct skins.
+    
+    Item data lives in the Backend's column arrays; a Skin only keeps its row
+    index into them and reads its properties from there.
     """
     
+    # Thousands of Skins stay cached for the app's lifetime; slots drop the per-instance __dict__
+    __slots__ = ('backend', 'id', '_row', 'float', '_tradeups_cache')
+    
     def __init__(self, item_id: int, backend: 'Backend'):
         self.backend = backend
         self.id: int = item_id
         
-        # Get the row data for this ID
-        row = self.backend.item_metadata[self.backend.item_metadata['id'] == item_id]
+        # Get the row index for this ID
+        row = self.backend._row_by_id.get(item_id)
         
-        if len(row) == 0:
+        if row is None:
             raise ValueError(f"No item found with id {item_id}")
         
-        # Extract all properties from the row
-        data = row.iloc[0]
-        self.name: str = data['name']
-        self.max_float: float = data['max_float']
-        self.min_float: float = data['min_float']
-        self.crates: List[str] = data['crates']
-        self.rarity: str = data['rarity']
-        self.weapon: str = data['weapon']
-        self.stattrack: bool = data['stattrack']
-        self.collection: str = data['collections']  # Single collection as string
+        self._row: int = row
         self.float: Optional[float] = None  # Float value for this specific instance
+        self._tradeups_cache: Optional[List['Skin']] = None  # Filled on first get_tradeups() call
+    
+    @property
+    def name(self) -> str:
+        return self.backend._names[self._row]
+    
+    @property
+    def max_float(self) -> float:
+        return self.backend._max_float[self._row]
+    
+    @property
+    def min_float(self) -> float:
+        return self.backend._min_float[self._row]
+    
+    @property
+    def crates(self) -> List[str]:
+        return self.backend._crates[self._row]
+    
+    @property
+    def rarity(self) -> str:
+        return self.backend._rarities[self.backend._rarity_code[self._row]]
+    
+    @property
+    def weapon(self) -> str:
+        return self.backend._weapons[self._row]
+    
+    @property
+    def stattrack(self) -> bool:
+        return self.backend._stattrack[self._row]
+    
+    @property
+    def collection(self) -> str:
+        """Single collection as string"""
+        return self.backend._collections[self.backend._collection_code[self._row]]
     
     def get_color(self) -> QColor:
         """Get the color associated with this skin's rarity"""
-        rarity_colors = {
-            "Consumer Grade": QColor("gray"),
-            "Industrial Grade": QColor("lightgray"),
-            "Mil-Spec Grade": QColor("blue"),
-            "Restricted": QColor("purple"),
-            "Classified": QColor("orange"),
-            "Covert": QColor("red"),
-            "Contraband": QColor("black"),
-            "Extraordinary": QColor("gold")
-        }
-        return rarity_colors[self.rarity]
+        return _RARITY_COLORS[self.rarity]
+    
+    def get_brush(self) -> QBrush:
+        """Get the shared brush for this skin's rarity color"""
+        return _RARITY_BRUSHES[self.rarity]
     
     def __repr__(self) -> str:
         return f"Skin(id={self.id}, name='{self.name}', rarity='{self.rarity}')"
     
+    # Skins are identified by item ID, so uncached instances still match cached ones
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Skin):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        return hash(self.id)
+    
 
     def get_tradeups(self) -> List['Skin']:
         """
@@ -71,25 +129,56 @@ class Skin:
         higher rarity tier. These are the possible outputs if this skin is used
         as an input in a trade-up contract.
         
+        The result only depends on collection and rarity, so it is computed once
+        and the same list is returned on later calls; callers must not mutate it.
+        
         Returns:
             List of Skin objects representing possible trade-up outcomes
         """
+        if self._tradeups_cache is not None:
+            return self._tradeups_cache
+        
         next_rarity = Backend.next_rarity(self.rarity)
         if not self.collection:
-            return []
+            self._tradeups_cache = []
+            return self._tradeups_cache
         
         # Find all items in the next rarity that are in the same collection
-        target_items = self.backend.item_metadata[
-            (self.backend.item_metadata['rarity'] == next_rarity) & 
-            (self.backend.item_metadata['collections'] == self.collection)
-        ]
+        key = (int(self.backend._collection_code[self._row]), self.backend._rarity_to_code.get(next_rarity))
+        target_ids = self.backend._tradeup_index.get(key, [])
         
-        return [self.backend.get_skin(row['id']) for _, row in target_items.iterrows()]
+        self._tradeups_cache = [self.backend.get_skin(item_id) for item_id in target_ids]
+        return self._tradeups_cache
 
 class Backend:
+    _RARITY_ORDER = [
+        "Consumer Grade",
+        "Industrial Grade",
+        "Mil-Spec Grade",
+        "Restricted",
+        "Classified",
+        "Covert",
+        "Extraordinary"
+    ]
+    # Rarity -> next tier up, precomputed so next_rarity() is a single dict lookup
+    _NEXT_RARITY = dict(zip(_RARITY_ORDER, _RARITY_ORDER[1:]))
+    _ANALYZE_CACHE_SIZE = 64  # Max remembered analyze_selected_skins results
+    # Columns read from item_metadata.csv and their types
+    _METADATA_DTYPES = {
+        'name': str,
+        'id': str,
+        'max_float': 'float64',
+        'min_float': 'float64',
+        'crates': str,
+        'rarity': 'category',
+        'weapon': 'category',
+        'stattrack': bool,
+    }
+
     def __init__(self, ui):
         self.ui = ui
         self._skin_cache = {}  # Cache for Skin objects
+        self._analyze_cache: "OrderedDict[tuple, str]" = OrderedDict()  # LRU of analysis text
         self.load()
         
         # Get all unique collections (now just strings)
@@ -97,62 +186,105 @@ class Backend:
         print("Unique collections:", sorted([c for c in unique_collections if c]))
 
     def load(self):
-        collections = pd.read_csv('item_collection_mapping.csv')
-        self.item_metadata = pd.read_csv('item_metadata.csv')
+        collections = pd.read_csv('item_collection_mapping.csv', dtype=str)
+        # Collections come from the mapping file, so the metadata's own (stale)
+        # collections column is never parsed; explicit dtypes skip type inference
+        self.item_metadata = pd.read_csv(
+            'item_metadata.csv',
+            usecols=list(self._METADATA_DTYPES),
+            dtype=self._METADATA_DTYPES,
+        )
         self.item_metadata = self.item_metadata.merge(collections, on="name", how="left")
-        
-        # Handle duplicate collections column from merge
-        if 'collections_y' in self.item_metadata.columns:
-            self.item_metadata = self.item_metadata.drop(columns=['collections_x'])
-            self.item_metadata = self.item_metadata.rename(columns={'collections_y': 'collections'})
 
         # Parse 'crates' column as list of strings (from string representations of lists)
+        # Many items share the same crate list, so parse each distinct literal only once
         if 'crates' in self.item_metadata.columns:
-            self.item_metadata['crates'] = self.item_metadata['crates'].fillna("[]").apply(
-                lambda x: ast.literal_eval(x) if isinstance(x, str) and x.startswith('[') else []
-            )
+            crates = self.item_metadata['crates'].fillna("[]")
+            parsed = {
+                x: _parse_list_literal(x) if isinstance(x, str) and x.startswith('[') else []
+                for x in crates.unique()
+            }
+            self.item_metadata['crates'] = crates.map(parsed)
         
         # Fill missing collections with empty string
         if 'collections' in self.item_metadata.columns:
-            self.item_metadata['collections'] = self.item_metadata['collections'].fillna("")
+            self.item_metadata['collections'] = self.item_metadata['collections'].fillna("").astype('category')
+
+        # Small integer codes for the low-cardinality (category dtype) columns, over every metadata row
+        rarity = self.item_metadata['rarity'].cat
+        collection = self.item_metadata['collections'].cat
+        rarity_codes = rarity.codes.to_numpy(np.uint8)
+        collection_codes = collection.codes.to_numpy()
+        self._rarities: List[str] = rarity.categories.tolist()
+        self._collections: List[str] = collection.categories.tolist()
+        self._rarity_to_code: dict[str, int] = {r: code for code, r in enumerate(self._rarities)}
+
+        # Columnar skin table, one row per id (first row wins if an item maps to several collections)
+        first = ~self.item_metadata['id'].duplicated().to_numpy()
+        skins = self.item_metadata[first].reset_index(drop=True)
+        self._row_by_id: dict[int, int] = {item_id: row for row, item_id in enumerate(skins['id'].tolist())}
+        self._names: List[str] = skins['name'].tolist()
+        # Name -> id of the first row with that name (StatTrak variants share names)
+        first_by_name = skins.drop_duplicates(subset='name')
+        self._name_to_id: dict[str, int] = dict(zip(first_by_name['name'].tolist(), first_by_name['id'].tolist()))
+        self._min_float: np.ndarray = skins['min_float'].to_numpy(np.float64)
+        self._max_float: np.ndarray = skins['max_float'].to_numpy(np.float64)
+        self._crates: List[List[str]] = skins['crates'].tolist()
+        self._weapons: List[str] = skins['weapon'].tolist()
+        self._stattrack: List[bool] = skins['stattrack'].tolist()
+        self._rarity_code: np.ndarray = rarity_codes[first]
+        self._collection_code: np.ndarray = collection_codes[first]
+
+        # Index ids by (collection code, rarity code) so trade-up outputs are a dict lookup
+        self._tradeup_index: dict[tuple[int, int], list[int]] = (
+            self.item_metadata['id'].groupby([collection_codes, rarity_codes], sort=False).agg(list).to_dict()
+        )
+
+        # IDs offered in the UI (excluding Extraordinary and Contraband), as an ndarray,
+        # with their rarity codes alongside so rarity filters are a numpy mask
+        mask = ~self.item_metadata['rarity'].isin(['Extraordinary', 'Contraband']).to_numpy()
+        self._filtered_ids = self.item_metadata['id'].to_numpy()[mask]
+        self._filtered_rarity_code = rarity_codes[mask]
+
+        # Build every Skin up front so lookups never construct on the hot path
+        self._skins_by_row: List[Skin] = []
+        for item_id in self._row_by_id:
+            skin = Skin(item_id, self)
+            self._skin_cache[item_id] = skin
+            self._skins_by_row.append(skin)
 
     def process_item(self, item):
         # Simulate some processing and update the UI
         self.ui.update_output(f"Processing item: {item.text()}")
 
-    def get_item_list(self):
-        """Get list of all item IDs (excluding Extraordinary and Contraband)"""
-        filtered = self.item_metadata[
-            ~self.item_metadata['rarity'].isin(['Extraordinary', 'Contraband'])
-        ]
-        return list(filtered['id'])
+    def get_item_list(self) -> np.ndarray:
+        """Get array of all item IDs (excluding Extraordinary and Contraband)"""
+        return self._filtered_ids
+    
+    def get_item_list_by_rarity(self, rarity: str) -> np.ndarray:
+        """Get array of item IDs from get_item_list() that have the given rarity"""
+        code = self._rarity_to_code.get(rarity)
+        if code is None:
+            return self._filtered_ids[:0]
+        return self._filtered_ids[self._filtered_rarity_code == code]
     
     def get_skin(self, item_id: int) -> Skin:
-        """Create a Skin object from an item ID (with caching)"""
-        if item_id not in self._skin_cache:
-            self._skin_cache[item_id] = Skin(item_id, self)
-        return self._skin_cache[item_id]
+        """Get the Skin object for an item ID (all skins are built in load())"""
+        try:
+            return self._skin_cache[item_id]
+        except KeyError:
+            raise ValueError(f"No item found with id {item_id}") from None
     
     def get_skin_by_name(self, name: str) -> Optional[Skin]:
-        """Create a Skin object from an item name"""
-        row = self.item_metadata[self.item_metadata['name'] == name]
-        if len(row) == 0:
+        """Get the Skin object for an item name"""
+        item_id = self._name_to_id.get(name)
+        if item_id is None:
             return None
-        item_id = row.iloc[0]['id']
-        return Skin(item_id, self)
+        return self.get_skin(item_id)
     
     @staticmethod 
     def next_rarity(rarity: str) -> str:
-        rarity_order = [
-            "Consumer Grade",
-            "Industrial Grade",
-            "Mil-Spec Grade",
-            "Restricted",
-            "Classified",
-            "Covert",
-            "Extraordinary"
-        ]
-        return rarity_order[rarity_order.index(rarity) + 1]
+        return Backend._NEXT_RARITY[rarity]
     
     @staticmethod
     def calculate_output_float(input_skins: List[Skin], output_skin: Skin) -> Optional[float]:
@@ -190,49 +322,96 @@ class Backend:
         # Calculate output float: f_out = min_f + f_bar * (max_f - min_f)
         f_out = min_f + f_bar * (max_f - min_f)
         
-        return f_out    
+        return f_out
+
+    def calculate_output_floats(self, input_skins: List[Skin], output_rows: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Vectorized calculate_output_float over several output skins.
+        
+        The average input float is computed once and remapped into every
+        output's [min_f, max_f] range in a single numpy expression over the
+        backend's float columns.
+        
+        Args:
+            input_skins: List of input skins with their float values
+            output_rows: Row indices (Skin._row) of the output skins
+            
+        Returns:
+            Array of output floats aligned with output_rows, or None if input floats not set
+        """
+        input_floats = [skin.float for skin in input_skins if skin.float is not None]
+        if not input_floats:
+            return None
+        
+        f_bar = sum(input_floats) / len(input_floats)
+        
+        min_f = self._min_float[output_rows]
+        max_f = self._max_float[output_rows]
+        
+        return min_f + f_bar * (max_f - min_f)
+
     def analyze_selected_skins(self, skins: List[Skin]) -> str:
         """Analyze the selected skins with their float values and return a description"""
         if not skins:
             return "No items selected"
-    
         
-        rarities = [skin.rarity for skin in skins]
-        collections = [skin.collection for skin in skins if skin.collection]  # List of collection strings
+        # The report is a pure function of the ordered (id, float) inputs, so
+        # repeated spinbox signals with unchanged values reuse the cached text
+        key = tuple((skin.id, skin.float) for skin in skins)
+        cached = self._analyze_cache.get(key)
+        if cached is not None:
+            self._analyze_cache.move_to_end(key)
+            return cached
         
-        result = "Selected Items:\n"
+        result = self._analyze_selected_skins(skins)
+        self._analyze_cache[key] = result
+        if len(self._analyze_cache) > self._ANALYZE_CACHE_SIZE:
+            self._analyze_cache.popitem(last=False)
+        return result
+
+    def _analyze_selected_skins(self, skins: List[Skin]) -> str:
+        """Build the analysis text for analyze_selected_skins (uncached)"""
+        # Single pass: list the inputs while collecting their rarities and collections
+        rarities = set()
+        collections = set()  # Collection strings
+        parts = ["Selected Items:\n"]
         for skin in skins:
+            rarities.add(skin.rarity)
+            if skin.collection:
+                collections.add(skin.collection)
             float_str = f"{skin.float:.4f}" if skin.float is not None else "Not set"
-            result += f" - {skin.name} (Float: {float_str})\n"
+            parts.append(f" - {skin.name} (Float: {float_str})\n")
 
-        result += "\nItem rarity check:\n"
-        if len(set(rarities)) != 1:
-            result += f"ERROR: Selected items have different rarities"
-            return result
+        parts.append("\nItem rarity check:\n")
+        if len(rarities) != 1:
+            parts.append(f"ERROR: Selected items have different rarities")
+            return "".join(parts)
         
-        result += f"All items have the same rarity: {rarities[0]}\n"
-        next_rarity = Backend.next_rarity(rarities[0])
-        result += f"Target rarity: {next_rarity}\n"
+        rarity = next(iter(rarities))
+        parts.append(f"All items have the same rarity: {rarity}\n")
+        next_rarity = Backend.next_rarity(rarity)
+        parts.append(f"Target rarity: {next_rarity}\n")
 
-        result += "\nTarget Collections:\n"
-        for collection in set(collections):
-            result += f" - {collection}\n"
+        parts.append("\nTarget Collections:\n")
+        for collection in collections:
+            parts.append(f" - {collection}\n")
         try:
             sorted_items = Backend.get_tradeup_outcomes(skins)
         except ValueError as e:
-            result += f"INVALID TRADEUP: {e}\n"
-            return result
+            parts.append(f"INVALID TRADEUP: {e}\n")
+            return "".join(parts)
 
-        result += "\nTrade-up Outcomes:\n"
+        parts.append("\nTrade-up Outcomes:\n")
         total = 0.0
-        for skin, prob in sorted_items:
-            output_float = Backend.calculate_output_float(skins, skin)
-            float_str = f"{output_float:.4f}" if output_float is not None else "N/A"
-            result += f" - {skin.name}: {prob:.2%} (Float: {float_str})\n"
+        output_rows = np.fromiter((skin._row for skin, _ in sorted_items), dtype=np.intp, count=len(sorted_items))
+        output_floats = self.calculate_output_floats(skins, output_rows)
+        for i, (skin, prob) in enumerate(sorted_items):
+            float_str = f"{output_floats[i]:.4f}" if output_floats is not None else "N/A"
+            parts.append(f" - {skin.name}: {prob:.2%} (Float: {float_str})\n")
             total += prob
-        result += f"Total probability: {total:.2%}\n"
+        parts.append(f"Total probability: {total:.2%}\n")
         
-        return result
+        return "".join(parts)
     
     @staticmethod
     def get_tradeup_outcomes(items: list[Skin]) -> List[Tuple[Skin, float]]:
@@ -272,7 +451,13 @@ class Backend:
         
         # Calculate probabilities for each possible output skin
         # P(s_out = s) = (n_c / N) * (1 / |S(c, r_out)|)
-        probabilities = defaultdict(float)
+        # Gather one (output row, contribution) pair per input/output combination,
+        # then sum contributions per output row with a single bincount
+        output_rows: List[int] = []
+        contributions: List[float] = []
+        
+        # n_c / N: probability of selecting this collection
+        collection_prob = 1.0 / len(items)
         
         for input_skin in items:
             # Get all possible outputs from this input's collection
@@ -281,16 +466,27 @@ class Backend:
             if not possible_outputs:
                 continue
             
-            # n_c / N: probability of selecting this collection
-            collection_prob = 1.0 / len(items)
-            
             # 1 / |S(c, r_out)|: uniform selection within collection
             skin_prob = 1.0 / len(possible_outputs)
             
-            # Add probability contribution to each possible output
-            for output_skin in possible_outputs:
-                probabilities[output_skin] += collection_prob * skin_prob
-
+            output_rows.extend(output_skin._row for output_skin in possible_outputs)
+            contributions.extend([collection_prob * skin_prob] * len(possible_outputs))
+        
+        if not output_rows:
+            return []
+        
+        rows = np.array(output_rows, dtype=np.intp)
+        probabilities = np.bincount(rows, weights=np.array(contributions))
+        
+        # Outputs in order of first appearance, so ties keep a stable order
+        unique_rows, first_seen = np.unique(rows, return_index=True)
+        outcome_rows = unique_rows[np.argsort(first_seen)]
+        outcome_probs = probabilities[outcome_rows]
+        
         # Sort by probability descending
-        sorted_outcomes = sorted(probabilities.items(), key=lambda x: x[1], reverse=True)
-        return sorted_outcomes
\ No newline at end of file
+        order = np.argsort(-outcome_probs, kind='stable')
+        skins_by_row = items[0].backend._skins_by_row
+        return [
+            (skins_by_row[row], prob)
+            for row, prob in zip(outcome_rows[order].tolist(), outcome_probs[order].tolist())
+        ]
\ No newline at end of file
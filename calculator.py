@@ -3,72 +3,75 @@ import os
 from dotenv import load_dotenv
 import pandas as pd
 from sqlalchemy.orm import Session
-from sqlalchemy import select, distinct
+from sqlalchemy import select, distinct, func
 import database.mapped_classes as mapClass
+
+def read_table_csv(path, mapped_class, dtype=None):
+  # Only parse the columns the target table maps; explicit dtypes skip pandas' inference pass
+  columns = [column.name for column in mapped_class.__table__.columns]
+  return pd.read_csv(path, usecols=columns, dtype=dtype)
+
 class calculator:
   def __init__(self, db_connection):
     self.db_connection = db_connection
     print("calculator initiated")
     
   def database_seeding(self):
-    item_metadata_df = pd.read_csv('item_metadata.csv')
+    item_metadata_df = read_table_csv('item_metadata.csv', mapClass.ItemMetadata, dtype={
+      'name': str, 'id': str, 'min_float': 'float64', 'max_float': 'float64', 'rarity': str,
+      'weapon': str, 'stattrack': bool, 'crates': str, 'collections': str,
+    })
     #db_connection.seed_items_table(item_metadata_df)
 
-    market_df = pd.read_csv('csgo2_items.csv')
+    market_df = read_table_csv('csgo2_items.csv', mapClass.ItemMarketData, dtype={
+      'name': str, 'hash_name': str, 'wear': str, 'sell_listings': 'int64', 'sell_price': 'int64',
+      'sell_price_text': str, 'sale_price_text': str, 'app_name': str, 'app_icon': str,
+      'asset_description': str, 'base_name': str,
+    })
     db_connection.seed_price_table(market_df)
     
-    item_crate_map = pd.read_csv('item_crate_mapping.csv')
+    item_crate_map = read_table_csv('item_crate_mapping.csv', mapClass.ItemCrateMapping, dtype=str)
     #db_connection.seed_item_crate_mapping_table(item_crate_map)
     
-    item_collection_map = pd.read_csv('item_collection_mapping.csv')
+    item_collection_map = read_table_csv('item_collection_mapping.csv', mapClass.ItemCollectionMapping, dtype=str)
     #db_connection.seed_item_collection_mapping_table(item_collection_map)
     
-  def expected_helper(self, items):
-    sum = 0
-    for item in items:
-      sum += item.sell_price
-    return sum/len(items)
-  
   def finding_expected_values(self, engine):
     with Session(engine) as session:
         self.expected_values = {}
-        unique_collections = session.query(mapClass.ItemCollectionMapping.collections).distinct().all()
-        unique_collections = [row[0] for row in unique_collections]
-        unique_rarities = session.query(mapClass.ItemMetadata.rarity).distinct().all()
-        unique_rarities = [row[0] for row in unique_rarities]
         wear_levels = {"Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred"}
 
-        for rarity in unique_rarities:
-            for collection in unique_collections:
-                for wear_level in wear_levels:
-                    items = (
-                        session.query(mapClass.ItemMarketData)
-                        .join(
-                            mapClass.ItemCollectionMapping,
-                            mapClass.ItemMarketData.base_name == mapClass.ItemCollectionMapping.name
-                        )
-                        .join(
-                            mapClass.ItemMetadata,
-                            mapClass.ItemMarketData.base_name == mapClass.ItemMetadata.name
-                        )
-                        .filter(
-                            mapClass.ItemCollectionMapping.collections == collection,
-                            mapClass.ItemMetadata.rarity == rarity,
-                            mapClass.ItemMarketData.wear == wear_level
-                        )
-                        .all()
-                    )
+        # One grouped query instead of a query per (rarity, collection, wear) combination;
+        # a Core select() yields plain row tuples, so no ORM objects are built
+        statement = (
+            select(
+                mapClass.ItemMetadata.rarity,
+                mapClass.ItemCollectionMapping.collections,
+                mapClass.ItemMarketData.wear,
+                func.avg(mapClass.ItemMarketData.sell_price),
+                func.count(),
+            )
+            .select_from(mapClass.ItemMarketData)
+            .join(
+                mapClass.ItemCollectionMapping,
+                mapClass.ItemMarketData.base_name == mapClass.ItemCollectionMapping.name
+            )
+            .join(
+                mapClass.ItemMetadata,
+                mapClass.ItemMarketData.base_name == mapClass.ItemMetadata.name
+            )
+            .where(mapClass.ItemMarketData.wear.in_(wear_levels))
+            .group_by(
+                mapClass.ItemMetadata.rarity,
+                mapClass.ItemCollectionMapping.collections,
+                mapClass.ItemMarketData.wear
+            )
+        )
 
-                    if not items:
-                        continue
-
-                    key = (rarity, collection, wear_level)
-                    self.expected_values[key] = self.expected_helper( items)
-                    print(f"Found {len(items)} items for {collection} | {rarity} | {wear_level}")            
-                    
-  
-    
-  
+        for rarity, collection, wear_level, average_price, count in session.execute(statement):
+            key = (rarity, collection, wear_level)
+            self.expected_values[key] = float(average_price)
+            print(f"Found {count} items for {collection} | {rarity} | {wear_level}")
 
 load_dotenv()
 db_password = os.getenv('DB_PASSWORD')
@@ -13,6 +13,9 @@ config = {
     'database': 'csgo'
 }
 
+# Rows per multi-row INSERT when seeding tables (instead of one INSERT per row)
+SEED_CHUNKSIZE = 1000
+
 class DatabaseConnection:
   def __init__(self, user, password, host, database):
     self.user = user
@@ -29,7 +32,7 @@ class DatabaseConnection:
   def seed_items_table(self, items_df):
     table_name="item_metadata"
     try:
-      items_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False, index_label=None)
+      items_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False, index_label=None, method='multi', chunksize=SEED_CHUNKSIZE)
       print(f"Data imported successfully into {self.database}.{table_name}")
     except Exception as e:
       print(e)
@@ -37,7 +40,7 @@ class DatabaseConnection:
   def seed_price_table(self, prices_df):
     table_name="item_market_data"
     try:
-      prices_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False)
+      prices_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False, method='multi', chunksize=SEED_CHUNKSIZE)
       print(f"Data imported successfully into {self.database}.{table_name}")
     except Exception as e:
       print(e)
@@ -45,7 +48,7 @@ class DatabaseConnection:
   def seed_item_crate_mapping_table(self, prices_df):
     table_name="item_crate_mapping"
     try:
-      prices_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False)
+      prices_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False, method='multi', chunksize=SEED_CHUNKSIZE)
       print(f"Data imported successfully into {self.database}.{table_name}")
     except Exception as e:
       print(e)
@@ -53,7 +56,7 @@ class DatabaseConnection:
   def seed_item_collection_mapping_table(self, prices_df):
     table_name="item_collection_mapping"
     try:
-      prices_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False)
+      prices_df.to_sql(name=table_name, con=self.engine, if_exists='append', index=False, method='multi', chunksize=SEED_CHUNKSIZE)
       print(f"Data imported successfully into {self.database}.{table_name}")
     except Exception as e:
       print(e)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Double, Text, SmallInteger, BigInteger
+from sqlalchemy import String, Double, Text, SmallInteger, BigInteger, Index
 from typing import Optional
 
 class Base(DeclarativeBase):
@@ -9,10 +9,10 @@ class ItemMetadata(Base):
     __tablename__ = "item_metadata"
 
     name: Mapped[str] = mapped_column(Text, primary_key=True)
-    id: Mapped[str] = mapped_column(Text, unique=True)
+    id: Mapped[str] = mapped_column(String(64), unique=True)
     min_float: Mapped[float] = mapped_column(Double)
     max_float: Mapped[float] = mapped_column(Double)
-    rarity: Mapped[str] = mapped_column(Text)
+    rarity: Mapped[str] = mapped_column(String(32), index=True)
     weapon: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     stattrack: Mapped[bool] = mapped_column(SmallInteger)    
     crates: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -24,6 +24,11 @@ class ItemMetadata(Base):
       
 class ItemMarketData(Base):
     __tablename__ = "item_market_data"
+    # MySQL can only index TEXT columns on a prefix, hence mysql_length
+    # Covers the base_name joins and wear filter in calculator.finding_expected_values
+    __table_args__ = (
+        Index("ix_item_market_data_base_name_wear", "base_name", "wear", mysql_length={"base_name": 255}),
+    )
 
     name: Mapped[str] = mapped_column(Text)
     hash_name: Mapped[str] = mapped_column(Text, index=True, primary_key=True)
@@ -51,6 +56,9 @@ class ItemCrateMapping(Base):
       
 class ItemCollectionMapping(Base):
     __tablename__ = "item_collection_mapping"
+    __table_args__ = (
+        Index("ix_item_collection_mapping_collections", "collections", mysql_length=255),
+    )
 
     name: Mapped[str] = mapped_column(Text, primary_key=True)
     collections: Mapped[str] = mapped_column(Text, primary_key=True)